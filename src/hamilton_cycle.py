@@ -58,10 +58,22 @@ Instance_ID,Num_Vertices,Num_Edges,Hamiltonian_Path,Hamiltonian_Cycle,Largest_Cy
 """
 
 import itertools
-from typing import List, Tuple, Set, Dict
+from array import array
+from typing import Callable, List, Tuple, Set, Dict
 
+from src.hamilton_numba import NUMBA_AVAILABLE, heldkarp_largest_cycle, heldkarp_table
 from src.helpers.hamilton_cycle_helper import HamiltonCycleAbstractClass
 
+#below this size the jit compile costs more than the python DP itself
+NUMBA_MIN_VERTICES = 12
+#brute force checks paths with a generated, unrolled validator up to this size
+UNROLL_MAX_VERTICES = 10
+#held-karp builds two n << n int32 tables one after the other (80MB each at 20 vertices),
+#bigger graphs are left to backtracking
+HELDKARP_MAX_VERTICES = 20
+#without numba the python DP gets slow well before the memory limit
+HELDKARP_MAX_VERTICES_PYTHON = 16
+
 
 class HamiltonCycleColoring(HamiltonCycleAbstractClass):
     """
@@ -72,8 +84,40 @@ class HamiltonCycleColoring(HamiltonCycleAbstractClass):
     of the CSV file just focus on the logic
     """
 
+    #unrolled path checks for brute force, generated once per n and shared by every instance
+    _validators: Dict[int, Callable[[Tuple[int, ...], Tuple[int, ...]], bool]] = {}
+
+    def _compile_validator(self, n: int) -> Callable[[Tuple[int, ...], Tuple[int, ...]], bool]:
+        #builds def _v{n}(p, A) that unpacks p and checks every consecutive pair with one
+        #straight line 'and' chain, so there is no loop or zip per permutation
+        validator = self._validators.get(n)
+        if validator is None:
+            names = ", ".join(f"p{i}" for i in range(n))
+            checks = " and ".join(f"(A[p{i}] >> p{i + 1}) & 1" for i in range(n - 1)) or "True"
+            source = f"def _v{n}(p, A):\n    {names}, = p\n    return bool({checks})\n"
+            namespace = {}
+            exec(source, namespace)
+            validator = self._validators[n] = namespace[f"_v{n}"]
+        return validator
+
+    #The runner calls every method on the same instance, so adjacency is built once per (vertices, edges)
+    def _cache_lookup(self, kind: str, vertices: Set[int], edges: List[Tuple[int]]):
+        self._cache = getattr(self, '_cache', {})
+        hit = self._cache.get((kind, id(vertices), id(edges)))
+        if hit is not None and hit[0] is vertices and hit[1] is edges: #ids can be reused once an object is gone
+            return hit[2]
+        return None
+
+    def _cache_store(self, kind: str, vertices: Set[int], edges: List[Tuple[int]], value):
+        #keep vertices and edges alive with the entry so their ids stay unique
+        self._cache[(kind, id(vertices), id(edges))] = (vertices, edges, value)
+        return value
+
     #Make a new helper method to construct an unweighted adjacency set
     def _build_adj_set(self, vertices: Set[int], edges: List[Tuple[int]]) -> Dict[int, Set[int]]:
+        cached = self._cache_lookup('adj_set', vertices, edges)
+        if cached is not None:
+            return cached
         
         adj_set = {v: set() for v in vertices}
         #here the edges willb be in unweighted tuples (u,v)
@@ -81,7 +125,95 @@ class HamiltonCycleColoring(HamiltonCycleAbstractClass):
             if u in adj_set and v in adj_set:
                 adj_set[u].add(v)
                 adj_set[v].add(u)
-        return adj_set
+        return self._cache_store('adj_set', vertices, edges, adj_set)
+
+    #Same adjacency but relabeled to 0..n-1 so vertices fit in a bitmask
+    def _build_adj_bits(self, vertices: Set[int], edges: List[Tuple[int]]) -> Tuple[Tuple[int, ...], Tuple[int, ...]]:
+        #returns (order, adj_bits): order[i] is the original label of i, bit j of adj_bits[i] is set for edge i-j
+        cached = self._cache_lookup('adj_bits', vertices, edges)
+        if cached is not None:
+            return cached
+
+        order = tuple(sorted(vertices))
+        index = {v: i for i, v in enumerate(order)}
+        adj_bits = [0] * len(order)
+        for u, neighbors in self._build_adj_set(vertices, edges).items():
+            for v in neighbors:
+                adj_bits[index[u]] |= 1 << index[v]
+        return self._cache_store('adj_bits', vertices, edges, (order, tuple(adj_bits)))
+
+    #Degree based pruning for the hamiltonian cycle search (Vandegriend style)
+    def _prune_forced(self, adj_bits: List[int], free: int, head: int, start: int) -> int:
+        #free = bitmask of vertices not on the path yet, the path runs start ... head
+        #returns -2 if no hamiltonian cycle can finish this path, the vertex that has to come
+        #right after head if one is forced, or -1 if there is nothing forced
+        ends = (1 << head) | (1 << start)
+        once = twice = thrice = 0 #vertices hit by 1 / 2 / 3+ forced edges
+        forced = -1
+        m = free
+        while m:
+            w = (m & -m).bit_length() - 1
+            m &= m - 1
+            avail = adj_bits[w] & (free | ends) & ~(1 << w) #edges w can still use in the residual graph
+            deg = avail.bit_count()
+            if deg < 2: #w can't be entered and left anymore
+                return -2
+            if deg == 2: #both of w's edges are forced into the cycle
+                thrice |= twice & avail
+                twice |= once & avail
+                once |= avail
+                if head != start and (avail >> head) & 1:
+                    forced = w
+        if head == start: #start still has both of its cycle edges open
+            if thrice & (free | ends):
+                return -2
+        elif thrice & free or twice & ends: #head and start only have one edge left each
+            return -2
+        return forced
+
+    def _hamilton_cycle_pruned(self, n: int, adj_bits: List[int]) -> List[int]:
+        #looks only for a full hamiltonian cycle, returns it (without repeating the start) or None
+        if n < 3: #make sure min cycle size is 3
+            return None
+        degrees = [(bits & ~(1 << v)).bit_count() for v, bits in enumerate(adj_bits)]
+        if min(degrees) < 2: #some vertex can't be on any cycle
+            return None
+        start = degrees.index(min(degrees)) #every hamiltonian cycle goes through it, fewest branches
+
+        def next_candidates(head: int, free: int) -> int:
+            forced = self._prune_forced(adj_bits, free, head, start)
+            if forced == -2:
+                return 0
+            return 1 << forced if forced >= 0 else adj_bits[head] & free
+
+        #iterative DFS, stack[i] holds the neighbors of path[i] that are still left to try
+        path = [start]
+        free = ((1 << n) - 1) ^ (1 << start)
+        stack = [next_candidates(start, free)]
+        #the search stops at the first cycle, so any (free, head) state reached before has
+        #already failed and is skipped, same as explored in hamilton_backtracking
+        failed = set()
+        while stack:
+            candidates = stack[-1]
+            if not candidates: #nothing left here, backtrack
+                stack.pop()
+                free |= 1 << path.pop()
+                continue
+            w = (candidates & -candidates).bit_length() - 1
+            stack[-1] = candidates & (candidates - 1)
+            state = (free ^ 1 << w) * n + w
+            if state in failed:
+                continue
+            failed.add(state)
+            path.append(w)
+            free ^= 1 << w
+            if not free: #everything is on the path
+                if (adj_bits[w] >> start) & 1: #closes back to the start
+                    return path
+                free |= 1 << path.pop()
+                continue
+            stack.append(next_candidates(w, free))
+        return None
 
     def hamilton_backtracking(
         self, vertices: set, edges: List[Tuple[int]]
@@ -91,93 +223,114 @@ class HamiltonCycleColoring(HamiltonCycleAbstractClass):
         #visit vertices once and return to start (cycle)
         #largestCycle cycle found 
 
-        adj_set = self._build_adj_set(vertices, edges) #change name to match others 
+        order, adj_bits = self._build_adj_bits(vertices, edges) #change name to match others 
         n = len(vertices)
-        self.foundPath = None
-        self.foundCycle = None
 
-        self.largestCycle = 0 #size of longest cylce 
+        #a hamiltonian cycle answers everything at once, and the pruned search finds one fast
+        cycle = self._hamilton_cycle_pruned(n, adj_bits)
+        if cycle is not None:
+            first = cycle.index(0) #rotate so the witness starts at order[0] like the DFS below
+            found_path = [order[v] for v in cycle[first:] + cycle[:first]]
+            return (True, found_path, True, found_path + [found_path[0]], n)
 
-        path = [] #store path
-        visited = set() #visited nodes     
-
-        def findPath(currentNode: int): #path exisits 
-            path.append(currentNode) #add to path
-            visited.add(currentNode) #check as visited
+        found_path = None
+        found_cycle = None
+        largest_cycle_size = 0 #size of longest cylce 
+        if n == 1: #a single vertex is already a path
+            found_path = [order[0]]
 
-            if len(path) >= 3 and path[0] in adj_set[currentNode]: #make sure min cycle size is 3 
-                if len(path) > self.largestCycle: #increse size
-                    self.largestCycle = len(path)
-            
-                if len(path) == n: #check if full cycle
-                    if not self.foundCycle: #store
-                        self.foundCycle = path + [path[0]] #add start to end to make cycle  
-    
-            if len(path) == n: #hamiltonian path found
-                if not self.foundPath: # Store the first one
-                    self.foundPath = path[:]
-
-            if self.foundPath and self.foundCycle: #recrusive step for both found 
-                path.pop() #back tracksteps
-                visited.remove(currentNode)
-                return
-
-            for neighbor in adj_set[currentNode]:
-                if neighbor not in visited: #stay on path
-                    findPath(neighbor)
-            
-            # backtrack same steps as before 
-            path.pop()
-            visited.remove(currentNode)
-
-        for startNode in vertices: #DFS from each node
-            if not self.foundPath or not self.foundCycle:
-                findPath(startNode)
-            else:
+        #DFS from each node with an explicit stack instead of recursion. path and stack are
+        #fixed size buffers indexed by depth, stack[d] holds the neighbors of path[d] still left to try
+        path = array('i', [0]) * n #store path
+        stack = [0] * n
+        for start in range(n):
+            if found_path and found_cycle:
                 break #everthing found
+            path[0] = start
+            visited = 1 << start #visited nodes as a bitmask, bit v set once v is on the path
+            stack[0] = adj_bits[start] & ~visited
+            depth = 0
+            #with the start fixed, everything below a node only depends on (visited, node), so a
+            #state reached again through a different ordering has nothing new to find
+            explored = set()
 
-        return ( #regular returns we need 
-            bool(self.foundPath),
-            self.foundPath,
-            bool(self.foundCycle),
-            self.foundCycle,
-            self.largestCycle
-        )
-   
-             #recurive stuff 
+            while depth >= 0:
+                candidates = stack[depth]
+                if not candidates: #every neighbor tried, back track steps
+                    visited ^= 1 << path[depth]
+                    depth -= 1
+                    continue
+                neighbor = (candidates & -candidates).bit_length() - 1 #pop the neighbors one bit at a time
+                stack[depth] = candidates & (candidates - 1)
+                state = (visited | 1 << neighbor) * n + neighbor
+                if state in explored:
+                    continue
+                explored.add(state)
+                depth += 1
+                path[depth] = neighbor #add to path
+                visited |= 1 << neighbor #check as visited
+                size = depth + 1
+
+                if size >= 3 and (adj_bits[neighbor] >> start) & 1: #make sure min cycle size is 3 
+                    if size > largest_cycle_size: #increse size
+                        largest_cycle_size = size
+                    if size == n and not found_cycle: #check if full cycle
+                        found_cycle = [order[v] for v in path] + [order[start]] #add start to end to make cycle  
+
+                if size == n and not found_path: #hamiltonian path found, store the first one
+                    found_path = [order[v] for v in path]
+
+                if found_path and found_cycle: #both found, stop searching
+                    break
 
-            #backtracking --> need to pop
+                stack[depth] = adj_bits[neighbor] & ~visited #stay on path
 
-            #return statement
+        return ( #regular returns we need 
+            bool(found_path),
+            found_path,
+            bool(found_cycle),
+            found_cycle,
+            largest_cycle_size
+        )
         
     def hamilton_bruteforce(
         self, vertices: set, edges: List[Tuple[int]]
     ) -> Tuple[bool, List[int], bool, List[int], int]:
         
-        adj_set = self._build_adj_set(vertices, edges)
-        n = len(vertices)
+        #order is the sorted vertex tuple, built once per instance and cached, and vertices are
+        #permuted as their indices 0..n-1. bit w of adj[v] is set when v-w is an edge, so an
+        #edge check is a shift and an AND
+        order, adj = self._build_adj_bits(vertices, edges)
+        n = len(order)
+        if n == 0:
+            return (False, None, False, None, 0)
         
         found_path = None
         found_cycle = None
         largest_cycle_size = 0 #this would be our best case 
         
-        #
-        for p in itertools.permutations(sorted(list(vertices))): #go through all permutaions
-            is_path = True
+        validator = None
+        if n <= UNROLL_MAX_VERTICES: #brute force is only practical here anyway
+            validator = self._compile_validator(n)
+
+        for p in itertools.permutations(range(n)): #go through all permutaions, same order as the sorted labels
             #lets checkk if its a valid path
-            for i in range(n-1):
-                if p[i+1] not in adj_set[p[i]]:
-                    is_path = False
-                    break
-            
+            if validator is not None:
+                is_path = validator(p, adj)
+            else: #plain loop so there is no generator frame per permutation
+                is_path = True
+                for a, b in zip(p, p[1:]):
+                    if not (adj[a] >> b) & 1:
+                        is_path = False
+                        break
             
             if is_path: #then we have found our Hamiltonian Path
                 if not found_path:
-                    found_path = list(p)
+                    found_path = [order[v] for v in p]
                     
                 # next we need to check if the path is also a cycle
-                if p[0] in adj_set[p[-1]]:
-                    found_cycle = list(p) + [p[0]]
+                if (adj[p[-1]] >> p[0]) & 1:
+                    found_cycle = [order[v] for v in p] + [order[p[0]]]
                     largest_cycle_size = n #if it reaches the start then it is the largest
                     return (True, found_path, True, found_cycle, largest_cycle_size) # if we found both we can return early
                 
@@ -189,11 +342,111 @@ class HamiltonCycleColoring(HamiltonCycleAbstractClass):
         #NO PATH or cycle found
         return (False, None, False, None, 0)
 
+    #Held-Karp style DP over (subset bitmask, endpoint) instead of walking every permutation
+    def _heldkarp_table(self, n: int, adj_bits: List[int], anchored: bool) -> array:
+        #dp[mask * n + v] is the vertex before v on a path that covers mask and ends at v (-1 = no such path)
+        #anchored=True only lets a path start at the lowest vertex of its mask, so closing edges give cycles
+        dp = array('i', [-1]) * (n << n)
+        for s in range(n):
+            dp[(1 << s) * n + s] = s #every single vertex is its own start
+
+        for mask in range(1, 1 << n): #supersets always come later so increasing order is enough
+            allowed = -1
+            if anchored:
+                allowed = ~(((mask & -mask) << 1) - 1) #only grow past the start vertex
+            base = mask * n
+            for v in range(n):
+                if dp[base + v] < 0:
+                    continue
+                succ = adj_bits[v] & ~mask & allowed
+                while succ: #pop the neighbors one bit at a time
+                    w = (succ & -succ).bit_length() - 1
+                    succ &= succ - 1
+                    idx = (mask | (1 << w)) * n + w
+                    if dp[idx] < 0:
+                        dp[idx] = v
+        return dp
+
+    def _heldkarp_largest_cycle(self, dp: array, n: int, adj_bits: List[int]) -> Tuple[int, int]:
+        #dp has to be anchored, returns (largest cycle size, end vertex of the full cycle or -1)
+        full = (1 << n) - 1
+        largest = 0
+        end = -1
+        for mask in range(1, 1 << n):
+            size = mask.bit_count()
+            if size < 3 or size <= largest: #make sure min cycle size is 3
+                continue
+            start = (mask & -mask).bit_length() - 1
+            base = mask * n
+            for v in range(n):
+                if dp[base + v] >= 0 and (adj_bits[v] >> start) & 1: #closes back to the start
+                    largest = size
+                    if mask == full:
+                        end = v
+                    break
+        return largest, end
+
+    def _heldkarp_walk(self, dp: array, n: int, mask: int, v: int) -> List[int]:
+        #follow the predecessors back to the start of the path
+        walk = []
+        while True:
+            walk.append(v)
+            if mask == 1 << v:
+                break
+            prev = int(dp[mask * n + v])
+            mask ^= 1 << v
+            v = prev
+        walk.reverse()
+        return walk
+
+    def hamilton_heldkarp(
+        self, vertices: set, edges: List[Tuple[int]]
+    ) -> Tuple[bool, List[int], bool, List[int], int]:
+        order, adj_bits = self._build_adj_bits(vertices, edges)
+        n = len(order)
+        if n == 0:
+            return (False, None, False, None, 0)
+        if n > HELDKARP_MAX_VERTICES: #the tables would not fit in memory
+            raise ValueError(f"held-karp supports at most {HELDKARP_MAX_VERTICES} vertices, got {n}")
+        full = (1 << n) - 1
+
+        table, largest_cycle = self._heldkarp_table, self._heldkarp_largest_cycle
+        if NUMBA_AVAILABLE and n >= NUMBA_MIN_VERTICES: #use the compiled kernels when we can
+            table, largest_cycle = heldkarp_table, heldkarp_largest_cycle
+
+        found_path = None
+        paths = table(n, adj_bits, anchored=False)
+        for v in range(n):
+            if paths[full * n + v] >= 0: #covers everything so it's a hamiltonian path
+                found_path = [order[i] for i in self._heldkarp_walk(paths, n, full, v)]
+                break
+        del paths
+
+        found_cycle = None
+        cycles = table(n, adj_bits, anchored=True)
+        largest_cycle_size, end = largest_cycle(cycles, n, adj_bits)
+        if end >= 0: #the largest cycle covers everything
+            walk = self._heldkarp_walk(cycles, n, full, end)
+            found_cycle = [order[i] for i in walk] + [order[walk[0]]]
+
+        return (
+            bool(found_path),
+            found_path,
+            bool(found_cycle),
+            found_cycle,
+            largest_cycle_size
+        )
+
     def hamilton_simple(
         self, vertices: set, edges: List[Tuple[int]]
     ) -> Tuple[bool, List[int], bool, List[int], int]: return (False, None,False,None,0)         #skip this, we didnt implement it
 
     def hamilton_bestcase(
         self, vertices: set, edges: List[Tuple[int]]
-    ) -> Tuple[bool, List[int], bool, List[int], int]: #best case is backtrakcing approach 
-         return self.hamilton_backtracking(vertices, edges)
\ No newline at end of file
+    ) -> Tuple[bool, List[int], bool, List[int], int]:
+        #best case is held-karp while its tables stay small, it does n*2^n work no matter how
+        #hard the graph is. past that the pruned backtracking approach takes over
+        limit = HELDKARP_MAX_VERTICES if NUMBA_AVAILABLE else HELDKARP_MAX_VERTICES_PYTHON
+        if len(vertices) <= limit:
+            return self.hamilton_heldkarp(vertices, edges)
+        return self.hamilton_backtracking(vertices, edges)
\ No newline at end of file
@@ -0,0 +1,91 @@
+"""
+Numba kernels for the Held-Karp Hamiltonian path/cycle DP
+---------------------------------------------------------
+Same (subset bitmask, endpoint) DP as HamiltonCycleColoring._heldkarp_table,
+compiled with numba so the bit twiddling runs without interpreter overhead.
+
+hamilton_bestcase runs this DP for graphs up to HELDKARP_MAX_VERTICES, so these
+kernels are what keep it fast there.
+
+numba is optional (the `jit` extra). When it can't be imported NUMBA_AVAILABLE is False and the
+solver keeps using its pure python DP, and bestcase only picks held-karp up to
+HELDKARP_MAX_VERTICES_PYTHON vertices. Walking the predecessor table back into
+a path is still done in python.
+"""
+
+from typing import List, Tuple
+
+import numpy as np
+
+try:
+    from numba import njit
+
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+    def njit(*args, **kwargs):
+        # plain python stand-in so this module still imports without numba
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
+
+
+@njit(cache=True, boundscheck=False)
+def _hk(n, adj_bits, dp, anchored):
+    # dp[mask, v] is the vertex before v on a path covering mask and ending at v (-1 = none)
+    for mask in range(1, 1 << n):
+        allowed = np.int64(-1)
+        if anchored:
+            allowed = ~(((mask & -mask) << 1) - 1)  # only grow past the start vertex
+        for v in range(n):
+            if dp[mask, v] < 0:
+                continue
+            succ = adj_bits[v] & ~mask & allowed
+            for w in range(n):
+                if (succ >> w) & 1:
+                    nxt = mask | (np.int64(1) << w)
+                    if dp[nxt, w] < 0:
+                        dp[nxt, w] = v
+    return dp
+
+
+@njit(cache=True, boundscheck=False)
+def _largest_cycle(n, adj_bits, dp):
+    # dp must come from an anchored run; returns (largest cycle size, endpoint of the full cycle or -1)
+    full = (np.int64(1) << n) - 1
+    largest = 0
+    end = -1
+    for mask in range(1, 1 << n):
+        size = 0
+        m = mask
+        while m:
+            m &= m - 1
+            size += 1
+        if size < 3 or size <= largest:
+            continue
+        low = mask & -mask
+        start = 0
+        while (low >> start) != 1:
+            start += 1
+        for v in range(n):
+            if dp[mask, v] >= 0 and (adj_bits[v] >> start) & 1:
+                largest = size
+                if mask == full:
+                    end = v
+                break
+    return largest, end
+
+
+def heldkarp_table(n: int, adj_bits: List[int], anchored: bool) -> np.ndarray:
+    # flattened so dp[mask * n + v] lines up with the pure python table
+    dp = np.full((1 << n, n), -1, dtype=np.int32)
+    for s in range(n):
+        dp[1 << s, s] = s  # every single vertex is its own start
+    _hk(n, np.asarray(adj_bits, dtype=np.int64), dp, anchored)
+    return dp.ravel()
+
+
+def heldkarp_largest_cycle(dp: np.ndarray, n: int, adj_bits: List[int]) -> Tuple[int, int]:
+    largest, end = _largest_cycle(n, np.asarray(adj_bits, dtype=np.int64), dp.reshape(1 << n, n))
+    return int(largest), int(end)